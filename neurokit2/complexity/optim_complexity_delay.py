@@ -1,29 +1,39 @@
-import itertools
+import functools
 from warnings import warn
 
 import matplotlib
 import matplotlib.collections
 import matplotlib.pyplot as plt
+import mpl_toolkits.mplot3d.art3d
 import numpy as np
 import pandas as pd
+import scipy.fft
 import scipy.signal
 import scipy.spatial
 import scipy.stats
 
-from ..misc import NeuroKitWarning, find_closest
+from ..misc import NeuroKitWarning, find_closest, parallel_run
 from ..signal import (
-    signal_autocor,
-    signal_findpeaks,
     signal_psd,
+    signal_sanitize,
     signal_surrogate,
-    signal_zerocrossings,
 )
 from .entropy_kl import entropy_kl
 from .information_mutual import mutual_information
 from .utils_complexity_embedding import complexity_embedding
 
 
-def complexity_delay(signal, delay_max=50, method="fraser1986", algorithm=None, show=False, silent=False, **kwargs):
+def complexity_delay(
+    signal,
+    delay_max=50,
+    method="fraser1986",
+    algorithm=None,
+    show=False,
+    silent=False,
+    n_jobs=1,
+    early_stop=False,
+    **kwargs,
+):
     """**Automated selection of the optimal Delay (Tau)**
 
     The time delay (Tau :math:`\\tau`, also referred to as *Lag*) is one of the two critical
@@ -54,6 +64,8 @@ def complexity_delay(signal, delay_max=50, method="fraser1986", algorithm=None,
       between the delayed and non-delayed time series, effectively identifying a value of Tau for
       which they share the least information (and where the attractor is the least redundant).
       Unlike autocorrelation, mutual information takes into account also nonlinear correlations.
+      A faster histogram-based estimate, in which the signal is binned only once and the bins are
+      reused for all the delays, can be obtained with ``method="mi3"``.
     * **Theiler (1990)** suggested to select Tau where the autocorrelation between the signal and
       its lagged version at Tau first crosses the value :math:`1/e`. The autocorrelation-based
       methods have the advantage of short computation times when calculated via the fast Fourier
@@ -107,8 +119,30 @@ def complexity_delay(signal, delay_max=50, method="fraser1986", algorithm=None,
         If ``True``, will plot the metric values for each value of tau.
     silent : bool
         If ``True``, silence possible warnings.
+    n_jobs : int
+        Number of threads used to compute the metric of the different delays in parallel (requires
+        the ``joblib`` package). Only used by the methods based on the mutual information and on the
+        displacement. ``-1`` means all cores. See :func:`parallel_run`.
+    early_stop : bool
+        Only used with ``method="fraser1986"`` or ``method="mi2"`` and the ``"first local minimum"``
+        (or ``"first local minimum (corrected)"``) algorithm. If ``True``, stop computing the mutual
+        information for higher delays as soon as a local minimum is confirmed by the 3 following
+        delays, and return that minimum (or, for the corrected algorithm, return the first delay if
+        the metric increases right away). This can be much faster when ``delay_max`` is large
+        compared to the optimal delay, but ``"Values"`` and ``"Scores"`` then stop at that point.
+        Note that **the selected delay can differ** from the one obtained without early stopping:
+        the latter only keeps the minima whose prominence is at least 10% of the most prominent one
+        over the whole curve, whereas early stopping returns the first minimum that is lower than
+        its neighbours, which on noisy signals can be a much earlier (or later) one. The delays are
+        then computed sequentially (i.e., ``n_jobs`` is ignored).
     **kwargs : optional
-        Additional arguments to be passed for C-C method.
+        Additional arguments to be passed to the computation of the metric, such as ``dimensions``
+        and ``r_vals`` for the C-C method, or ``subsample`` for the autocorrelation-based methods.
+        ``subsample`` is an integer factor (or ``"auto"``) by which the signal is downsampled before
+        computing the autocorrelation (the values being then linearly interpolated back to all the
+        delays), which speeds up the computation for long signals in which the delays of interest
+        are much larger than one sample. ``"auto"`` picks a factor that keeps at least 10 coarse
+        lags up to ``delay_max``.
 
     Returns
     -------
@@ -272,6 +306,10 @@ def complexity_delay(signal, delay_max=50, method="fraser1986", algorithm=None,
         metric = "Mutual Information 2"
         if algorithm is None:
             algorithm = "first local minimum"
+    elif method in ["mi3"]:
+        metric = "Mutual Information 3"
+        if algorithm is None:
+            algorithm = "first local minimum"
     elif method in ["theiler", "theiler1990"]:
         metric = "Autocorrelation"
         if algorithm is None:
@@ -300,10 +338,21 @@ def complexity_delay(signal, delay_max=50, method="fraser1986", algorithm=None,
         raise ValueError("complexity_delay(): 'method' not recognized.")
 
     # Get metric
-    metric_values = _embedding_delay_metric(signal, tau_sequence, metric=metric)
+    if early_stop is True and algorithm in ["first local minimum", "first local minimum (corrected)"]:
+        early_stop = algorithm
+    else:
+        early_stop = None
+    metric_values = _embedding_delay_metric(
+        signal, tau_sequence, metric=metric, n_jobs=n_jobs, early_stop=early_stop, **kwargs
+    )
 
     # Get optimal tau
-    optimal = _embedding_delay_select(metric_values, algorithm=algorithm)
+    if early_stop and len(metric_values) < len(tau_sequence):
+        # The sweep stopped as soon as the first local minimum was confirmed by the next delays
+        optimal = _embedding_delay_minimum_lookahead(metric_values, algorithm=early_stop)
+    else:
+        optimal = _embedding_delay_select(metric_values, algorithm=algorithm)
+    tau_sequence = tau_sequence[: len(metric_values)]  # In case the sweep stopped early
 
     if np.isnan(optimal) and silent is False:
         warn(
@@ -344,12 +393,10 @@ def _embedding_delay_select(metric_values, algorithm="first local minimum"):
         elif all(np.diff(metric_values) < 0):
             optimal = len(metric_values) - 1
         else:
-            # Find reversed peaks
-            optimal = signal_findpeaks(-1 * metric_values, relative_height_min=0.1, relative_max=True)["Peaks"]
+            optimal = _embedding_delay_minima(metric_values)
     elif algorithm == "first local minimum":
-        # Find reversed peaks
         try:
-            optimal = signal_findpeaks(-1 * metric_values, relative_height_min=0.1, relative_max=True)["Peaks"]
+            optimal = _embedding_delay_minima(metric_values)
         except ValueError:
             warn(
                 "First local minimum detection failed. Try setting "
@@ -359,10 +406,9 @@ def _embedding_delay_select(metric_values, algorithm="first local minimum"):
             optimal = np.nan
 
     elif algorithm == "first 1/e crossing":
-        metric_values = metric_values - 1 / np.exp(1)
-        optimal = signal_zerocrossings(metric_values)
+        optimal = _embedding_delay_crossing(metric_values, threshold=1 / np.e)
     elif algorithm == "first zero crossing":
-        optimal = signal_zerocrossings(metric_values)
+        optimal = _embedding_delay_crossing(metric_values, threshold=0)
     elif algorithm == "closest to 40% of the slope":
         slope = np.diff(metric_values) * len(metric_values)
         slope_in_deg = np.rad2deg(np.arctan(slope))
@@ -382,6 +428,30 @@ def _embedding_delay_select(metric_values, algorithm="first local minimum"):
     return optimal
 
 
+def _embedding_delay_minima(metric_values):
+    """Find the local minima of the metric that have a prominence of at least 10% of the most
+    prominent one. Equivalent to ``signal_findpeaks(-1 * metric_values, relative_height_min=0.1,
+    relative_max=True)["Peaks"]``, but without computing the other peak features (widths, onsets,
+    etc.) that are not needed here.
+    """
+    minima, info = scipy.signal.find_peaks(-1 * np.asarray(metric_values), prominence=0)
+    prominences = info["prominences"]
+
+    return minima[prominences / np.max(prominences) >= 0.1]
+
+
+def _embedding_delay_crossing(metric_values, threshold=0):
+    """Index of the first crossing of the threshold by the metric (i.e., the first of the zero
+    crossings of ``metric_values - threshold``), or NaN if it never crosses it.
+    """
+    signs = np.sign(np.asarray(metric_values) - threshold)
+    crossings = np.abs(np.diff(signs)) > 0  # Comparisons with NaNs are never crossings
+    if not np.any(crossings):
+        return np.nan
+
+    return np.argmax(crossings)
+
+
 # =============================================================================
 def _embedding_delay_metric(
     signal,
@@ -389,16 +459,34 @@ def _embedding_delay_metric(
     metric="Mutual Information",
     dimensions=[2, 3, 4, 5],
     r_vals=[0.5, 1.0, 1.5, 2.0],
+    n_jobs=1,
+    subsample=1,
+    early_stop=None,
 ):
     """Iterating through dimensions and r values is relevant only if metric used is Correlation Integral.
     For this method, either first zero crossing of the statistic averages or the first local
     minimum of deviations to obtain optimal tau. This implementation takes the latter since in practice,
     they are both in close proximity.
+
+    If ``early_stop`` is the name of a "first local minimum" algorithm, the mutual information is
+    only computed up to the first confirmed local minimum, and the values are truncated there.
     """
+    # Convert once to a contiguous float array, so that lagged versions are views of it
+    signal = np.ascontiguousarray(signal_sanitize(signal), dtype=float)
+
+    # The autocorrelation can be approximated on a downsampled signal
+    if subsample == "auto":
+        # Keep at least 10 samples per maximum delay, and at least 10 coarse lags up to it
+        delay_max = int(np.max(tau_sequence))
+        subsample = max(1, min(len(signal) // (10 * delay_max), delay_max // 10))
+    if subsample > 1 and metric == "Autocorrelation":
+        return _embedding_delay_autocor_subsampled(signal, lags=len(tau_sequence), subsample=subsample)
 
     if metric == "Autocorrelation":
-        values, _ = signal_autocor(signal)
-        values = values[: len(tau_sequence)]  # upper limit
+        values = _embedding_delay_autocor(signal, lags=len(tau_sequence))
+
+    elif metric == "Mutual Information 3":
+        values = _embedding_delay_mi_binned(signal, tau_sequence)
 
     elif metric == "Correlation Integral":
         r_vals = [i * np.std(signal) for i in r_vals]
@@ -418,31 +506,177 @@ def _embedding_delay_metric(
                 deviation = _embedding_delay_cc_deviation_max(signal, delay=t, dimension=m, r_vals=r_vals)
                 change += deviation
             # averages[i] = average / 16
-            values[i] = change / 4
+            values[i] = change / len(dimensions)
+
+    elif metric in ["Mutual Information", "Mutual Information 2", "Displacement"]:
+        # The 2D embedding only consists of the signal and its lagged version, so we can
+        # directly use views of the signal instead of building the embedding matrix
+        if metric not in ["Mutual Information", "Mutual Information 2"]:
+            early_stop = None
+        if n_jobs == 1 or early_stop is not None:
+            values = np.zeros(len(tau_sequence))
+            buffer = np.empty(len(signal))  # Scratch space, shared across delays
+            for i, current_tau in enumerate(tau_sequence):
+                x, y = signal[:-current_tau], signal[current_tau:]
+                values[i] = _embedding_delay_metric_2d(x, y, metric=metric, out=buffer[: len(x)])
+                if early_stop is not None and not np.isnan(
+                    _embedding_delay_minimum_lookahead(values[: i + 1], algorithm=early_stop)
+                ):
+                    values = values[: i + 1]
+                    break
+        else:
+            # Delays are independent, and most of the work releases the GIL, so use threads
+            values = parallel_run(
+                _embedding_delay_metric_2d,
+                [{"x": signal[:-t], "y": signal[t:], "metric": metric} for t in tau_sequence],
+                n_jobs=n_jobs,
+                prefer="threads",
+            )
+            values = np.array(values, dtype=float)
 
     else:
-        values = np.zeros(len(tau_sequence))
+        raise ValueError("'metric' not recognized.")
+
+    return values
+
+
+def _embedding_delay_minimum_lookahead(metric_values, lookahead=3, algorithm="first local minimum"):
+    """Index of the value ``lookahead`` steps before the last one if it is a local minimum (i.e.,
+    lower than the value before it and than all the values after it), or NaN otherwise. For the
+    corrected algorithm, the first index is returned if the metric increases right away.
+    """
+    if algorithm == "first local minimum (corrected)" and len(metric_values) == 2:
+        if metric_values[1] > metric_values[0]:
+            return 0
+
+    k = len(metric_values) - 1 - lookahead
+    if k < 1 or metric_values[k] >= metric_values[k - 1] or np.any(metric_values[k + 1 :] <= metric_values[k]):
+        return np.nan
+
+    return k
 
-        # Loop through taus and compute all scores values
-        for i, current_tau in enumerate(tau_sequence):
-            embedded = complexity_embedding(signal, delay=current_tau, dimension=2)
-            if metric == "Mutual Information":
-                values[i] = mutual_information(embedded[:, 0], embedded[:, 1], method="varoquaux")
-            elif metric == "Mutual Information 2":
-                values[i] = mutual_information(embedded[:, 0], embedded[:, 1], method="knn")
-            elif metric == "Displacement":
-                dimension = 2
-
-                # Reconstruct with zero time delay.
-                tau0 = embedded[:, 0].repeat(dimension).reshape(len(embedded), dimension)
-                dist = np.asarray([scipy.spatial.distance.euclidean(i, j) for i, j in zip(embedded, tau0)])
-                values[i] = np.mean(dist)
-            else:
-                raise ValueError("'metric' not recognized.")
+
+def _embedding_delay_autocor_subsampled(signal, lags=50, subsample=2):
+    """Autocorrelation computed on the signal downsampled by an integer factor, in which a lag of j
+    samples corresponds to a lag of j * subsample samples of the original signal, and linearly
+    interpolated back to lags 0 to ``lags - 1``. The lags shorter than ``subsample`` are computed
+    exactly on the original signal, as interpolating them from lag 0 (which includes the variance of
+    the noise) would bias them upward.
+    """
+    coarse_lags = np.arange(int(np.ceil((lags - 1) / subsample)) + 1)
+    coarse_values = _embedding_delay_autocor(signal[::subsample], lags=len(coarse_lags))
+    values = np.interp(np.arange(lags), coarse_lags * subsample, coarse_values)
+
+    # Exact autocorrelation of the short lags
+    signal = signal - np.nanmean(signal)
+    short = np.array([np.dot(signal[: len(signal) - k], signal[k:]) for k in range(min(subsample, lags))])
+    values[: len(short)] = short / short[0]
+
+    return values
+
+
+def _embedding_delay_metric_2d(x, y, metric="Mutual Information", out=None):
+    """Compute the metric between the signal (x) and its lagged version (y)."""
+    if metric == "Mutual Information":
+        return mutual_information(x, y, method="varoquaux")
+    elif metric == "Mutual Information 2":
+        return mutual_information(x, y, method="knn")
+    elif metric == "Displacement":
+        # Euclidean distance to the zero-delay reconstruction (i.e., the diagonal), which in
+        # 2D reduces to the absolute difference between the two coordinates.
+        diff = np.subtract(y, x, out=out)
+        return np.mean(np.abs(diff, out=diff))
+
+
+def _embedding_delay_autocor(signal, lags=50):
+    """Autocorrelation of the signal at lags 0 to ``lags - 1``. Similar to ``signal_autocor()``, but
+    the FFT is only zero-padded to what is needed to avoid circular overlap at the requested lags,
+    and only these lags are returned instead of the full autocorrelation.
+    """
+    signal = signal - np.nanmean(signal)
+
+    n = scipy.fft.next_fast_len(len(signal) + lags)
+    fft = scipy.fft.rfft(signal, n)
+    acov = scipy.fft.irfft(fft * np.conjugate(fft), n)[:lags]
+
+    # Normalize (so that max correlation is 1)
+    return acov / acov[0]
+
+
+def _embedding_delay_mi_binned(signal, tau_sequence):
+    """Normalized Shannon mutual information between the signal and its lagged versions. The signal
+    is binned once, and the joint histogram of each delay is obtained by counting the pairs of bin
+    indices, which avoids re-binning the signal for every delay.
+    """
+    nbins = int(np.round(np.sqrt(len(signal))))
+
+    # Assign each sample to a bin (from 0 to nbins - 1)
+    edges = np.linspace(np.min(signal), np.max(signal), nbins + 1)
+    bin_ids = np.digitize(signal, edges[1:-1])
+
+    # Compute all delays in a single compiled call if numba is installed
+    try:
+        kernel = _embedding_delay_mi_binned_numba()
+    except ImportError:
+        kernel = None
+    if kernel is not None:
+        return kernel(bin_ids, nbins, np.asarray(tau_sequence, dtype=np.int64))
+
+    values = np.zeros(len(tau_sequence))
+    for i, current_tau in enumerate(tau_sequence):
+        # Joint histogram (counts) of the non-delayed (rows) and delayed (columns) bins
+        pairs = bin_ids[:-current_tau] * nbins + bin_ids[current_tau:]
+        n = len(pairs)
+        c_xy = np.bincount(pairs, minlength=nbins**2).reshape(nbins, nbins)
+        c_x = np.sum(c_xy, axis=1)
+        c_y = np.sum(c_xy, axis=0)
+
+        # p * log(p / (px * py)) from the non-empty cells only (in the limit p -> 0, p*log(p) is 0),
+        # with probabilities obtained by dividing the counts by n
+        rows, cols = np.nonzero(c_xy)
+        c = c_xy[rows, cols]
+        mi = np.sum(c * np.log(c * n / (c_x[rows] * c_y[cols]))) / n
+        values[i] = mi / np.log(nbins)
 
     return values
 
 
+@functools.lru_cache(maxsize=None)
+def _embedding_delay_mi_binned_numba():
+    import numba
+
+    @numba.njit(fastmath=True, cache=True)
+    def mi_all_taus(bin_ids, nbins, taus):
+        N = len(bin_ids)
+        out = np.empty(len(taus))
+        p_xy = np.zeros((nbins, nbins), dtype=np.int64)
+        p_x = np.zeros(nbins, dtype=np.int64)
+        p_y = np.zeros(nbins, dtype=np.int64)
+        for k in range(len(taus)):
+            t = taus[k]
+            n = N - t
+
+            # Joint and marginal histograms (counts)
+            p_xy[:] = 0
+            p_x[:] = 0
+            p_y[:] = 0
+            for i in range(n):
+                p_xy[bin_ids[i], bin_ids[i + t]] += 1
+                p_x[bin_ids[i]] += 1
+                p_y[bin_ids[i + t]] += 1
+
+            # p * log(p / (px * py)), with probabilities obtained by dividing counts by n
+            mi = 0.0
+            for a in range(nbins):
+                for b in range(nbins):
+                    if p_xy[a, b] > 0:
+                        mi += p_xy[a, b] * np.log(p_xy[a, b] * n / (p_x[a] * p_y[b]))
+            out[k] = mi / n / np.log(nbins)
+        return out
+
+    return mi_all_taus
+
+
 # =============================================================================
 # Internals for C-C method, Kim et al. (1999)
 # =============================================================================
@@ -451,33 +685,75 @@ def _embedding_delay_metric(
 def _embedding_delay_cc_integral_sum(signal, dimension=3, delay=10, r=0.02):
     """Correlation integral is a cumulative distribution function, which denotes
     the probability of distance between any pairs of points in phase space
-    not greater than the specified `r`.
+    not greater than the specified `r`. If `r` is a list, the pairwise distances
+    are computed once and the integral is returned for each value of `r`.
     """
 
     # Embed signal
-    embedded = complexity_embedding(signal, delay=delay, dimension=dimension, show=False)
-    M = embedded.shape[0]
-
-    # Prepare indices for comparing all unique pairwise vectors
-    combinations = list(itertools.combinations(range(0, M), r=2))
-    first_index, second_index = (
-        np.transpose(combinations)[0],
-        np.transpose(combinations)[1],
-    )
+    embedded = _embedding_delay_view(signal, delay=delay, dimension=dimension)
+    M = embedded.shape[0]  # Number of embedded points
 
-    vectorized_integral = np.vectorize(_embedding_delay_cc_integral, excluded=["embedded", "r"])
-    integral = np.sum(vectorized_integral(first_index=first_index, second_index=second_index, embedded=embedded, r=r))
+    # Number of unique pairwise vectors with a sup-norm distance not greater than r
+    counts = _embedding_delay_cc_counts(embedded, np.ravel(r)).reshape(np.shape(r))
+    integral = (2 / (M * (M - 1))) * counts  # find average
 
     return integral
 
 
-def _embedding_delay_cc_integral(first_index, second_index, embedded, r=0.02):
-    M = embedded.shape[0]  # Number of embedded points
-    diff = np.linalg.norm(embedded[first_index] - embedded[second_index], ord=np.inf)  # sup-norm
-    h = np.heaviside(r - diff, 1)
-    integral = (2 / (M * (M - 1))) * h  # find average
+def _embedding_delay_view(signal, delay=10, dimension=3):
+    """Same as ``complexity_embedding()``, but returns a read-only view of the signal instead of
+    copying its values in a new array. The numba kernel of ``_embedding_delay_cc_counts()`` reads
+    the embedded points directly from this view, whereas scipy's pdist makes its own copy."""
+    if dimension * delay > len(signal):
+        raise ValueError(
+            "NeuroKit error: _embedding_delay_view(): dimension * delay should be lower than"
+            + " the length of the signal."
+        )
+    if delay < 1:
+        raise ValueError("NeuroKit error: _embedding_delay_view(): 'delay' has to be at least 1.")
+    window = (dimension - 1) * delay + 1
+    return np.lib.stride_tricks.sliding_window_view(signal, window)[:, ::delay]
 
-    return integral
+
+def _embedding_delay_cc_counts(embedded, r):
+    """Count the unique pairs of embedded points whose sup-norm distance is not greater than each
+    value of r. Uses a compiled kernel if numba is installed, which streams over the pairs without
+    materializing the O(M^2) pairwise distances, and falls back on scipy's pdist otherwise.
+    """
+    try:
+        kernel = _embedding_delay_cc_counts_numba()
+    except ImportError:
+        dists = scipy.spatial.distance.pdist(embedded, metric="chebyshev")  # Copies the embedding
+        return np.array([np.count_nonzero(dists <= i) for i in r])
+
+    # Distances are kept in double precision: pdist upcasts to float64 anyway, and single precision
+    # does not speed up the kernel (which is compute-bound) while it could flip the pairs lying at r.
+    # The kernel handles strided arrays, so a float view of the signal is not copied.
+    return kernel(np.asarray(embedded, dtype=float), np.asarray(r, dtype=float))
+
+
+@functools.lru_cache(maxsize=None)
+def _embedding_delay_cc_counts_numba():
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def cc_counts(embedded, r):
+        M, D = embedded.shape
+        # One row of counts per point to avoid race conditions across threads
+        counts = np.zeros((M, r.size), dtype=np.int64)
+        for i in numba.prange(M):
+            for j in range(i + 1, M):
+                dist = 0.0
+                for k in range(D):
+                    d = abs(embedded[i, k] - embedded[j, k])
+                    if d > dist:
+                        dist = d
+                for ri in range(r.size):
+                    if dist <= r[ri]:
+                        counts[i, ri] += 1
+        return counts.sum(axis=0)
+
+    return cc_counts
 
 
 def _embedding_delay_cc_statistic(signal, dimension=3, delay=10, r=0.02):
@@ -486,12 +762,13 @@ def _embedding_delay_cc_statistic(signal, dimension=3, delay=10, r=0.02):
     # create disjoint time series
     series = [signal[i - 1 :: delay] for i in range(1, delay + 1)]
 
+    # The 1-dimensional integral of the whole signal does not depend on the sub-series
+    integral_1 = _embedding_delay_cc_integral_sum(signal, dimension=1, delay=delay, r=r)
+
     statistic = 0
     for sub_series in series:
-        diff = _embedding_delay_cc_integral_sum(sub_series, dimension=dimension, delay=delay, r=r) - (
-            (_embedding_delay_cc_integral_sum(signal, dimension=1, delay=delay, r=r)) ** dimension
-        )
-        statistic += diff
+        diff = _embedding_delay_cc_integral_sum(sub_series, dimension=dimension, delay=delay, r=r)
+        statistic += diff - integral_1**dimension
 
     return statistic / delay
 
@@ -500,16 +777,11 @@ def _embedding_delay_cc_deviation_max(signal, r_vals=[0.5, 1.0, 1.5, 2.0], delay
     """A measure of the variation of the dependence statistic with r using
     several representative values of r.
     """
-    vectorized_deviation = np.vectorize(_embedding_delay_cc_deviation, excluded=["signal", "delay", "dimension"])
-    deviations = vectorized_deviation(signal=signal, r_vals=r_vals, delay=delay, dimension=dimension)
+    deviations = _embedding_delay_cc_statistic(signal, delay=delay, dimension=dimension, r=np.asarray(r_vals))
 
     return np.max(deviations) - np.min(deviations)
 
 
-def _embedding_delay_cc_deviation(signal, r_vals=[0.5, 1.0, 1.5, 2.0], delay=10, dimension=3):
-    return _embedding_delay_cc_statistic(signal, delay=delay, dimension=dimension, r=r_vals)
-
-
 # =============================================================================
 # Plotting Generics
 # =============================================================================
@@ -555,8 +827,6 @@ def _embedding_delay_plot(
 
     # Colors
     norm = plt.Normalize(z.min(), z.max())
-    cmap = plt.get_cmap("plasma")
-    colors = cmap(norm(x))
 
     # Attractor for 2D vs 3D
     if plot == "2D":
@@ -569,10 +839,11 @@ def _embedding_delay_plot(
     elif plot == "3D":
         points = np.array([x, y, z]).T.reshape(-1, 1, 3)
         segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        for i in range(len(x) - 1):
-            seg = segments[i]
-            (line,) = ax1.plot(seg[:, 0], seg[:, 1], seg[:, 2], color=colors[i])
-            line.set_solid_capstyle("round")
+        lc = mpl_toolkits.mplot3d.art3d.Line3DCollection(segments, cmap="plasma", norm=norm)
+        lc.set_array(x[:-1])
+        lc.set_capstyle("round")
+        ax1.add_collection3d(lc)
+        ax1.set_zlim(z.min(), z.max())
         ax1.set_zlabel("Signal [i-" + str(2 * tau) + "]")
 
     return fig
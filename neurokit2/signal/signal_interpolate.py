@@ -16,10 +16,12 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
     ----------
     x_values : Union[list, np.array, pd.Series]
         The samples corresponding to the values to be interpolated.
-    y_values : Union[list, np.array, pd.Series]
+    y_values : Union[list, np.array, pd.Series, pd.DataFrame]
         The values to be interpolated. If not provided, any NaNs in the x_values
         will be interpolated with :func:`_signal_interpolate_nan`,
-        considering the x_values as equally spaced.
+        considering the x_values as equally spaced. If 2D, each column is interpolated, which
+        is faster than interpolating each signal separately, as the interpolator is only built
+        once for all signals sharing the same x_values.
     x_new : Union[list, np.array, pd.Series] or int
         The samples at which to interpolate the y_values. Samples before the first value in x_values
         or after the last value in x_values will be extrapolated. If an integer is passed, nex_x
@@ -48,7 +50,7 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
     Returns
     -------
     array
-        Vector of interpolated samples.
+        Vector of interpolated samples (or array with one column per signal if y_values is 2D).
 
     See Also
     --------
@@ -85,6 +87,13 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
       @suppress
       plt.close()
 
+    .. ipython:: python
+
+      # Interpolate several signals sharing the same x_values at once
+      signals = np.column_stack([signal, signal**2])
+      interpolated = nk.signal_interpolate(x_values, signals, x_new=x_new, method="cubic")
+      interpolated.shape
+
     """
     # Sanity checks
     if x_values is None:
@@ -98,6 +107,8 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
         x_new = np.squeeze(x_new.values)
     if isinstance(y_values, pd.Series):
         y_values = np.squeeze(y_values.values)
+    if isinstance(y_values, pd.DataFrame):
+        y_values = y_values.values
 
     if len(x_values) != len(y_values):
         raise ValueError("x_values and y_values must be of the same length.")
@@ -118,7 +129,7 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
 
     # If only one value, return a constant signal
     if len(x_values) == 1:
-        return np.ones(len(x_new)) * y_values[0]
+        return np.ones((len(x_new),) + np.shape(y_values)[1:]) * y_values[0]
 
     if method == "monotone_cubic":
         interpolation_function = scipy.interpolate.PchipInterpolator(x_values, y_values, extrapolate=True)
@@ -126,11 +137,20 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
         interpolation_function = scipy.interpolate.Akima1DInterpolator(x_values, y_values)
     else:
         if fill_value is None:
-            fill_value = ([y_values[0]], [y_values[-1]])
+            fill_value = (y_values[0], y_values[-1])
+        # Simple methods don't need any setup, so skip the overhead of scipy's interp1d
+        if (
+            method in ["linear", "nearest", "previous", "next"]
+            and not isinstance(fill_value, str)
+            and (method != "linear" or np.ndim(y_values) == 1)
+            and not np.any(np.isnan(x_values))
+        ):
+            return _signal_interpolate_numpy(x_values, y_values, x_new, method=method, fill_value=fill_value)
         interpolation_function = scipy.interpolate.interp1d(
             x_values,
             y_values,
             kind=method,
+            axis=0,
             bounds_error=False,
             fill_value=fill_value,
         )
@@ -138,22 +158,53 @@ def signal_interpolate(x_values, y_values=None, x_new=None, method="quadratic",
     interpolated = interpolation_function(x_new)
 
     if method == "monotone_cubic" and fill_value != "extrapolate":
-        # Find the index of the new x value that is closest to the first original x value
-        first_index = np.argmin(np.abs(x_new - x_values[0]))
-        # Find the index of the new x value that is closest to the last original x value
-        last_index = np.argmin(np.abs(x_new - x_values[-1]))
+        # Find the bounds of the new x values that fall within the range of the original x values
+        first_index = np.searchsorted(x_new, x_values[0], side="left")
+        last_index = np.searchsorted(x_new, x_values[-1], side="right")
 
         if fill_value is None:
             # Swap out the cubic extrapolation of out-of-bounds segments generated by
             # scipy.interpolate.PchipInterpolator for constant extrapolation akin to the behavior of
             # scipy.interpolate.interp1d with fill_value=([y_values[0]], [y_values[-1]].
-            fill_value = ([interpolated[first_index]], [interpolated[last_index]])
+            fill_value = (y_values[0], y_values[-1])
         elif isinstance(fill_value, (float, int)):
             # if only a single integer or float is provided as a fill value, format as a tuple
-            fill_value = ([fill_value], [fill_value])
+            fill_value = (fill_value, fill_value)
 
         interpolated[:first_index] = fill_value[0]
-        interpolated[last_index + 1 :] = fill_value[1]
+        interpolated[last_index:] = fill_value[1]
+
+    return interpolated
+
+
+def _signal_interpolate_numpy(x_values, y_values, x_new, method="linear", fill_value=None):
+    """Equivalent of ``scipy.interpolate.interp1d(..., bounds_error=False)`` for the "linear",
+    "nearest", "previous" and "next" methods, using NumPy only."""
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    x_new = np.asarray(x_new, dtype=float)
+
+    if not isinstance(fill_value, tuple):
+        fill_value = (fill_value, fill_value)
+
+    if np.any(x_values[1:] < x_values[:-1]):
+        order = np.argsort(x_values, kind="mergesort")
+        x_values, y_values = x_values[order], y_values[order]
+
+    if method == "linear":
+        interpolated = np.interp(x_new, x_values, y_values)
+    else:
+        if method == "previous":
+            idx = np.searchsorted(x_values, x_new, side="right") - 1
+        elif method == "next":
+            idx = np.searchsorted(x_values, x_new, side="left")
+        else:  # "nearest" (rounding down at the midpoints)
+            idx = np.searchsorted((x_values[1:] + x_values[:-1]) / 2, x_new, side="left")
+        interpolated = y_values[np.clip(idx, 0, len(y_values) - 1)]
+
+    # Fill out-of-bounds values
+    interpolated[x_new < x_values[0]] = fill_value[0]
+    interpolated[x_new > x_values[-1]] = fill_value[1]
 
     return interpolated
 
@@ -186,5 +237,10 @@ def _signal_interpolate_nan(values, method="quadratic", fill_value=None):
 
 def _signal_interpolate_average_duplicates(x_values, y_values):
     unique_x, indices = np.unique(x_values, return_inverse=True)
-    mean_y = np.bincount(indices, weights=y_values) / np.bincount(indices)
+    counts = np.bincount(indices)
+    if np.ndim(y_values) == 1:
+        mean_y = np.bincount(indices, weights=y_values) / counts
+    else:
+        mean_y = np.column_stack([np.bincount(indices, weights=y) for y in np.transpose(y_values)])
+        mean_y = mean_y / counts[:, np.newaxis]
     return unique_x, mean_y
@@ -1,15 +1,19 @@
+import importlib
 from collections.abc import Iterable
 
 import antropy
 import nolds
 import numpy as np
 import pandas as pd
+import sklearn.metrics
 import sklearn.neighbors
 from pyentrp import entropy as pyentrp
 
 # import EntropyHub
 import neurokit2 as nk
 
+optim_complexity_delay_module = importlib.import_module("neurokit2.complexity.optim_complexity_delay")
+
 
 # For the testing of complexity, we test our implementations against existing and established ones.
 # However, some of these other implementations are not really packaged in a way
@@ -47,6 +51,83 @@ def test_complexity_sanity():
         atol=0.01,
     )
 
+    # Delay
+    _, parameters = nk.complexity_delay(signal, delay_max=50, method="mi3")
+    nbins = int(np.round(np.sqrt(len(signal))))
+    bins = np.digitize(signal, np.linspace(np.min(signal), np.max(signal), nbins + 1)[1:-1])
+    mi = [sklearn.metrics.mutual_info_score(bins[:-t], bins[t:]) / np.log(nbins) for t in range(1, 51)]
+    assert np.allclose(parameters["Scores"], mi, atol=0.000001)
+
+    _, parameters = nk.complexity_delay(signal[0:300], delay_max=5, method="kim1999")
+    assert np.allclose(
+        parameters["Scores"],
+        [0.16413442, 0.18142143, 0.14823648, 0.09898863, 0.07370436],
+        atol=0.000001,
+    )
+
+    for method in ["fraser1986", "rosenstein1994"]:
+        delay, parameters = nk.complexity_delay(signal, delay_max=50, method=method)
+        delay2, parameters2 = nk.complexity_delay(signal, delay_max=50, method=method, n_jobs=2)
+        assert delay2 == delay
+        assert np.allclose(parameters2["Scores"], parameters["Scores"])
+
+    delay, parameters = nk.complexity_delay(signal, delay_max=100, method="fraser1986")
+    delay2, parameters2 = nk.complexity_delay(signal, delay_max=100, method="fraser1986", early_stop=True)
+    assert delay2 == delay
+    assert len(parameters2["Scores"]) == len(parameters2["Values"]) == delay + 3
+    assert np.allclose(parameters2["Scores"], parameters["Scores"][0 : delay + 3])
+
+    # The corrected algorithm returns the first delay if the metric increases right away
+    noisy = nk.signal_simulate(duration=10, sampling_rate=100, frequency=[1, 3], noise=0.2, random_state=1)
+    args = {"delay_max": 30, "method": "fraser1986", "algorithm": "first local minimum (corrected)"}
+    delay, _ = nk.complexity_delay(noisy, **args)
+    delay2, parameters2 = nk.complexity_delay(noisy, early_stop=True, **args)
+    assert delay == delay2 == 1
+    assert len(parameters2["Scores"]) == 2
+
+    ecg = nk.ecg_simulate(duration=60, sampling_rate=1000, random_state=2)
+    for method in ["theiler1990", "casdagli1991"]:
+        delay, parameters = nk.complexity_delay(ecg, delay_max=50, method=method)
+        delay2, parameters2 = nk.complexity_delay(ecg, delay_max=50, method=method, subsample="auto")
+        assert np.abs(delay2 - delay) <= 1
+        assert np.allclose(parameters2["Scores"], parameters["Scores"], atol=0.01)
+
+    # The short lags (that include the noise) are not interpolated from lag 0
+    sine = nk.signal_simulate(duration=100, sampling_rate=1000, frequency=[0.5, 1.3], noise=0.1, random_state=3)
+    delay, parameters = nk.complexity_delay(sine, delay_max=500, method="theiler1990")
+    delay2, parameters2 = nk.complexity_delay(sine, delay_max=500, method="theiler1990", subsample=10)
+    assert delay2 == delay
+    assert np.allclose(parameters2["Scores"], parameters["Scores"], atol=0.01)
+
+
+def _raise_importerror():
+    raise ImportError
+
+
+def test_complexity_delay_mi3_without_numba(monkeypatch):
+    # Use the NumPy fallback that is run when numba is not installed
+    monkeypatch.setattr(optim_complexity_delay_module, "_embedding_delay_mi_binned_numba", _raise_importerror)
+
+    signal = np.cos(np.linspace(start=0, stop=30, num=1000))
+    _, parameters = nk.complexity_delay(signal, delay_max=50, method="mi3")
+    nbins = int(np.round(np.sqrt(len(signal))))
+    bins = np.digitize(signal, np.linspace(np.min(signal), np.max(signal), nbins + 1)[1:-1])
+    mi = [sklearn.metrics.mutual_info_score(bins[:-t], bins[t:]) / np.log(nbins) for t in range(1, 51)]
+    assert np.allclose(parameters["Scores"], mi, atol=0.000001)
+
+
+def test_complexity_delay_cc_without_numba(monkeypatch):
+    # Use the pdist fallback that is run when numba is not installed
+    monkeypatch.setattr(optim_complexity_delay_module, "_embedding_delay_cc_counts_numba", _raise_importerror)
+
+    signal = np.cos(np.linspace(start=0, stop=30, num=1000))
+    _, parameters = nk.complexity_delay(signal[0:300], delay_max=5, method="kim1999")
+    assert np.allclose(
+        parameters["Scores"],
+        [0.16413442, 0.18142143, 0.14823648, 0.09898863, 0.07370436],
+        atol=0.000001,
+    )
+
 
 # =============================================================================
 # Comparison against R
@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pytest
+import scipy.interpolate
 import scipy.signal
 
 import neurokit2 as nk
@@ -203,6 +204,50 @@ def test_signal_interpolate():
     assert interpolated[0] == signal.iloc[0]
     assert interpolated[-1] == signal.iloc[-1]
 
+    # Test constant extrapolation of monotone cubic
+    interpolated = nk.signal_interpolate(x_axis, signal, np.linspace(0, 40, 333), method="monotone_cubic")
+    assert np.all(interpolated[np.linspace(0, 40, 333) < x_axis.iloc[0]] == signal.iloc[0])
+    assert np.all(interpolated[np.linspace(0, 40, 333) > x_axis.iloc[-1]] == signal.iloc[-1])
+
+    # Test with multiple signals
+    signals = pd.DataFrame({"cos": signal, "sin": np.sin(x_axis)})
+    for method in ["linear", "previous", "cubic", "monotone_cubic", "akima"]:
+        interpolated = nk.signal_interpolate(x_axis, signals, x_new, method=method)
+        assert interpolated.shape == (1000, 2)
+        for i, col in enumerate(signals.columns):
+            assert np.allclose(
+                interpolated[:, i],
+                nk.signal_interpolate(x_axis, signals[col], x_new, method=method),
+                equal_nan=True,
+            )
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest", "previous", "next"])
+@pytest.mark.parametrize("fill_value", [None, 0, np.nan, (-1, 1)])
+@pytest.mark.parametrize("unsorted", [False, True])
+@pytest.mark.parametrize("integer", [False, True])
+def test_signal_interpolate_simple(method, fill_value, unsorted, integer):
+    # The simple methods bypass scipy, so check that the results match scipy.interpolate.interp1d
+    x_values = np.array([0, 1, 2, 4, 5, 8, 9])
+    y_values = np.array([3, -1, 4, 1, -5, 9, 2])
+    if integer is False:
+        y_values = y_values * 0.5
+    if unsorted is True:
+        order = [3, 0, 6, 2, 5, 1, 4]
+        x_values, y_values = x_values[order], y_values[order]
+    # Outside of the range, on the original points, at the midpoints (for "nearest") and NaN
+    x_new = np.array([-2, -0.5, 0, 0.3, 0.5, 1.5, 3, 4, 4.5, 6.5, 7, 8.5, 9, 9.5, 12, np.nan])
+
+    interpolated = nk.signal_interpolate(x_values, y_values, x_new=x_new, method=method, fill_value=fill_value)
+    expected = scipy.interpolate.interp1d(
+        x_values,
+        y_values,
+        kind=method,
+        bounds_error=False,
+        fill_value=(y_values[0], y_values[-1]) if fill_value is None else fill_value,
+    )(x_new)
+    assert np.allclose(interpolated, expected, equal_nan=True)
+
 
 def test_signal_findpeaks():
     signal1 = np.cos(np.linspace(start=0, stop=30, num=1000))